@@ -1,14 +1,38 @@
+from __future__ import annotations
+
+import time
+
+_T0 = time.perf_counter()  # launch reference for --startup-report
+
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import filedialog, messagebox, ttk
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
 import threading
-import pandas as pd
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import argparse
+import ipaddress
+import math
+import re
 import socket
 import struct
-import time
 import subprocess
+import sys
+
+if TYPE_CHECKING:
+    import pandas as pd  # imported lazily; it dominates startup time
+
+_T_IMPORTS = time.perf_counter()
 
 EPS = 1e-3
 EOS_PORT = 3032  # ETC EOS OSC over TCP default
+FRAME_MS = 33    # GUI frame tick when reading shared state (~30 fps)
+
+HEARTBEAT_INTERVAL = 1.0   # seconds between /eos/ping
+HEARTBEAT_MAX_MISSED = 3   # unanswered pings before the link is dead
 
 
 HELP_TEXT = r"""
@@ -41,9 +65,17 @@ Shows the next expected cue from your callsheet in relation to EOS. Glows red wh
 ### EOS
 Displays the active and pending ETC EOS cues.
 
+Underneath is the Link health: how long the console takes to answer a ping and how many recent pings it answered. If the console stops answering (e.g. a cable is pulled) SpotCue notices within a few seconds and starts reconnecting.
+
 ### Visual Cue
 If you've labeled a cue as "VISUAL" in your CSV, it appears here and glows red once the last numbered cue before it fires.
 
+### Callsheet Overview
+Press the ≡ icon in the top right to show your whole callsheet down the side. The current cue is highlighted green and the next cue red, and the list scrolls along with the show. You can scroll ahead with the mouse wheel; it jumps back on the next cue.
+
+### Show Preview
+Press the ▶ icon to check your callsheet before the half. Give it the console's cue numbers in running order: type them in (e.g. `1 2 3.5 4-10`), load a text file, use the cues fired so far this session, or read the cue list straight from the console. SpotCue works out what every section would show for the whole show. Drag the slider to scrub through it. Any callsheet cues that never fire, are out of order or are VISUALs that never appear are listed underneath. "Export running order…" saves a printable running order as text or CSV.
+
 **Each section displays:**
 - LIVE Status - If you are live in the scene a green tag with "LIVE" will appear.
 - DEAD Status - If you are off in the scene a red tag with "RED" will appear.
@@ -78,6 +110,12 @@ pip install pandas
 python SpotCue.py
 ```
 
+**Optional flags:**
+- `--ingest-process` — Reads the EOS connection in a separate process, so a busy console can't slow down the screen. It restarts itself if it crashes.
+- `--startup-report` — Prints how long each part of startup took (window, adapter scan, connection, CSV).
+- `--heartbeat-interval` / `--heartbeat-misses` — How often to ping the console (default every 1 second) and how many unanswered pings count as a lost connection (default 3).
+- `--soak` — Plays a simulated 8 hour show from a pretend console on your own machine, as fast as the display can keep up, without opening the window. It checks that memory use and display latency stay flat, prints a sample every 10 simulated minutes and ends with PASS or FAIL (a full run takes around 25 minutes). Tune it with `--soak-hours`, `--soak-rate` (messages per second), `--soak-sample-minutes` and `--soak-csv` (your own callsheet). It needs at least 4 samples to judge a trend.
+
 ---
 
 ## ⚙️ Settings & Configuration + Help
@@ -88,7 +126,7 @@ python SpotCue.py
 - You must be on the same physical network as your console
 - A wired connection is reccomended
 - Ensure your IPV4 settings are properly configured so your subnet matches and you are on the same IP range. (e.g. my console is 10.101.90.11, so my machine is 10.101.90.50)
-3. Enter your Primary ETC EOS console's IP address
+3. Enter your Primary ETC EOS console's IP address, or press Discover to search the selected adapter's network for consoles. Up to five are listed, fastest first; click the one you want to connect to. Nothing changes until you pick one
 4. The connection status will update when you go back to the main GUI
 
 ### CSV Format
@@ -108,7 +146,7 @@ Create a spreadsheet with the following column headers (exact capitalization req
 - Colour
     - This can be anything to best suit your setup. E.g. "L201" or "Light Blue"
 - Note
-    - Any additional information can be put here. It should be a small notation as word wrapping is not part of this tool to ensure every other section is visable.
+    - Any additional information can be put here. Longer notes are wrapped and the text is shrunk to fit its section, but shorter notes stay bigger and easier to read.
 
 **Important:**
 - **LX Cue**: Must contain a known LX Cue number or "VISUAL"
@@ -141,6 +179,8 @@ I am no coder and so AI has been used to generate the coding for this tool. I am
 # CSV Parsing
 # =====================================================================
 def read_csv(path: str) -> pd.DataFrame:
+    import pandas as pd
+
     df = pd.read_csv(path)
     df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
     if "LX Cue" not in df.columns:
@@ -150,6 +190,8 @@ def read_csv(path: str) -> pd.DataFrame:
 
 
 def format_row(row: pd.Series) -> str:
+    import pandas as pd
+
     lines = []
     for col in row.index:
         if col.lower() == "lx cue (num)":
@@ -164,15 +206,190 @@ def format_row(row: pd.Series) -> str:
     return "\n".join(lines)
 
 
+def format_row_summaries(df: pd.DataFrame) -> list[str]:
+    """One-line summaries of every row, for the callsheet overview."""
+    cols = [c for c in df.columns if c.lower() != "lx cue (num)"]
+    text = df[cols].astype("object").where(df[cols].notna(), "")
+    return [" · ".join(str(v) for v in vals if str(v) != "")
+            for vals in text.itertuples(index=False, name=None)]
+
+
+# =====================================================================
+# Cue mapping
+# =====================================================================
+class DisplayState(NamedTuple):
+    """Callsheet rows the display shows for one EOS cue."""
+    current: int | None      # None while waiting for the first cue
+    next: int | None         # None at the end of the callsheet
+    visual: int | None
+    current_lx: float | None
+    next_lx: float | None
+    armed: bool              # the pending EOS cue is the next spot cue
+
+
+def visual_row_for_lx(df: pd.DataFrame, current_lx: float) -> int | None:
+    """The first VISUAL row whose preceding numbered cue is current_lx."""
+    numeric = df[df["LX Cue (num)"].notna()]
+    visual = df[df["LX Cue"].astype(str).str.lower() == "visual"]
+
+    for i in visual.index:
+        prev = numeric[numeric.index < i]
+        if prev.empty:
+            continue
+        trigger = prev.iloc[-1]["LX Cue (num)"]
+        if abs(trigger - current_lx) < EPS:
+            return i
+    return None
+
+
+def map_eos_cue(df: pd.DataFrame | None, eos_cue: float,
+                pending_cue: float | None = None) -> DisplayState | None:
+    """Map an EOS cue onto the callsheet; None if there is nothing to show."""
+    if df is None or df.empty:
+        return None
+    numeric = df[df["LX Cue (num)"].notna()]
+    if numeric.empty:
+        return None
+
+    first_lx = numeric.iloc[0]["LX Cue (num)"]
+
+    idx = None
+    if eos_cue >= first_lx:
+        exact = numeric[abs(numeric["LX Cue (num)"] - eos_cue) < EPS]
+        if not exact.empty:
+            idx = exact.index[0]
+        else:
+            below = numeric[numeric["LX Cue (num)"] <= eos_cue]
+            if not below.empty:
+                idx = below.index[-1]
+
+    # BEFORE FIRST CUE -----------------------------------------------------
+    if idx is None:
+        armed = bool(pending_cue) and abs(pending_cue - first_lx) < EPS
+        return DisplayState(None, numeric.index[0],
+                            visual_row_for_lx(df, first_lx),
+                            None, first_lx, armed)
+
+    # NORMAL MAPPING -------------------------------------------------------
+    lx = df.loc[idx, "LX Cue (num)"]
+    nxt = numeric[numeric.index > idx]
+    next_idx = nxt.index[0] if not nxt.empty else None
+    next_lx = nxt.iloc[0]["LX Cue (num)"] if not nxt.empty else None
+
+    armed = False
+    if pending_cue and next_lx:
+        pending_match = numeric[
+            abs(numeric["LX Cue (num)"] - pending_cue) < EPS
+        ]
+        armed = bool(not pending_match.empty and
+                     pending_match.iloc[0]["LX Cue (num)"] == next_lx)
+
+    return DisplayState(idx, next_idx, visual_row_for_lx(df, lx),
+                        lx, next_lx, armed)
+
+
+def pulse_colour(i: int, steps: int) -> str:
+    """Colour for step i of the Current-cue pulse (0 … 2 * steps)."""
+    # Triangle wave 0→1→0
+    if i <= steps:
+        t = i / steps
+    else:
+        t = (2 * steps - i) / steps
+
+    # Green fade 30% → 100% → 30%
+    g = int(255 * (0.3 + 0.7 * t))
+    g = max(0, min(255, g))
+    return f"#00{g:02x}00"
+
+
+class CueView(NamedTuple):
+    """What the display shows after one cue packet."""
+    state: DisplayState
+    current_text: str
+    next_text: str
+    visual_text: str
+    pulse: bool              # the Current text changed
+
+
+class CueEngine:
+    """Tk-free cue state behind the display.
+
+    Tracks the active and pending EOS cues, the session log and the last
+    Current text, and turns each packet into a CueView for SpotCueApp to
+    paint. The soak test drives this class directly.
+    """
+
+    def __init__(self, lookahead: int = 3):
+        self.df: pd.DataFrame | None = None
+        self.lookahead = lookahead
+        self.current_cue: float | None = None
+        self.pending_cue: float | None = None
+        self.current_lx: float | None = None
+        self.next_lx: float | None = None
+        self.session_log: list[float] = []  # active cues this session
+        self.last_idx: int | None = None
+        self._last_current_text = None
+
+    def active(self, cue: float) -> CueView | None:
+        self.current_cue = cue
+        if not self.session_log or self.session_log[-1] != cue:
+            self.session_log.append(cue)
+        return self.view(cue)
+
+    def pending(self, cue: float) -> CueView | None:
+        self.pending_cue = cue
+        if self.current_cue is None:
+            return None
+        return self.view(self.current_cue)
+
+    def view(self, eos_cue: float) -> CueView | None:
+        state = map_eos_cue(self.df, eos_cue, self.pending_cue)
+        if state is None:
+            return None
+        df = self.df
+
+        if state.current is None:
+            current_text = "Waiting for first cue…"
+            pulse = False
+        else:
+            self.current_lx = state.current_lx
+            current_text = format_row(df.loc[state.current])
+            pulse = self._last_current_text != current_text
+        self._last_current_text = current_text
+
+        self.next_lx = state.next_lx
+        next_text = format_row(df.loc[state.next]) \
+            if state.next is not None else "End of cues"
+        visual_text = format_row(df.loc[state.visual]) \
+            if state.visual is not None else ""
+
+        self.last_idx = -1 if state.current is None else state.current
+        return CueView(state, current_text, next_text, visual_text, pulse)
+
+    def upcoming_texts(self, idx: int | None) -> list[str]:
+        """Text of the next few numbered rows and the next VISUAL after idx."""
+        df = self.df
+        if df is None or idx is None:
+            return []
+        numeric = df[df["LX Cue (num)"].notna()]
+        rows = list(numeric.index[numeric.index > idx][:self.lookahead])
+        visual = df.index[df["LX Cue"].astype(str).str.lower() == "visual"]
+        rows += [i for i in visual if i > idx][:1]
+        return [format_row(df.loc[i]) for i in rows]
+
+
 # =====================================================================
 # Adapter listing (Windows)
 # =====================================================================
+UNKNOWN_ADAPTER = ("Unknown — 0.0.0.0 / Unknown", "0.0.0.0", "Unknown")
+
+
 def list_adapters():
     adapters = []
     try:
         output = subprocess.check_output("ipconfig", shell=True, text=True)
     except Exception:
-        return [("Unknown — 0.0.0.0 / Unknown", "0.0.0.0", "Unknown")]
+        return [UNKNOWN_ADAPTER]
 
     name = ip = mask = None
 
@@ -198,7 +415,7 @@ def list_adapters():
     if name and ip:
         adapters.append((f"{name} — {ip} / {mask}", ip, mask))
 
-    return adapters or [("Unknown — 0.0.0.0 / Unknown", "0.0.0.0", "Unknown")]
+    return adapters or [UNKNOWN_ADAPTER]
 
 
 # =====================================================================
@@ -231,52 +448,1685 @@ def parse_osc_string(data: bytes, offset: int) -> tuple[str, int]:
     return s, end + 1 + pad
 
 
+def parse_eos_cue(packet: bytes) -> tuple[str, float] | None:
+    """Return ("active" | "pending", cue) for an EOS cue packet, else None."""
+    addr, _ = parse_osc_string(packet, 0)
+    parts = addr.split("/")
+
+    if len(parts) >= 7 and parts[1] == "eos" \
+       and parts[2] == "out" and parts[4] == "cue":
+        section = parts[3]
+        if section not in ("active", "pending"):
+            return None
+        try:
+            return section, float(parts[6])
+        except ValueError:
+            return None
+    return None
+
+
+def parse_osc_args(data: bytes, offset: int) -> list:
+    """Parse the type tag and s/i/f arguments following an address."""
+    tags, offset = parse_osc_string(data, offset)
+    args = []
+    for tag in tags[1:] if tags.startswith(",") else "":
+        if tag == "s":
+            val, offset = parse_osc_string(data, offset)
+        elif tag in "if" and offset + 4 <= len(data):
+            (val,) = struct.unpack_from(">i" if tag == "i" else ">f",
+                                        data, offset)
+            offset += 4
+        else:
+            break
+        args.append(val)
+    return args
+
+
+def _osc_pad(b: bytes) -> bytes:
+    b += b"\0"
+    return b + b"\0" * ((4 - len(b) % 4) % 4)
+
+
+def build_osc_packet(addr: str, *args) -> bytes:
+    """Encode an OSC message with s/i/f arguments, length-prefixed for TCP."""
+    tags = ","
+    payload = b""
+    for a in args:
+        if isinstance(a, str):
+            tags += "s"
+            payload += _osc_pad(a.encode())
+        elif isinstance(a, int):
+            tags += "i"
+            payload += struct.pack(">i", a)
+        else:
+            tags += "f"
+            payload += struct.pack(">f", a)
+    msg = _osc_pad(addr.encode()) + _osc_pad(tags.encode()) + payload
+    return struct.pack(">I", len(msg)) + msg
+
+
+class PacketBuffer:
+    """Reassemble length-prefixed OSC packets from arbitrary recv chunks."""
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def feed(self, data: bytes):
+        self.buf += data
+
+    def packets(self):
+        while len(self.buf) >= 4:
+            (size,) = struct.unpack_from(">I", self.buf, 0)
+            if len(self.buf) < 4 + size:
+                return
+            packet = bytes(self.buf[4:4 + size])
+            del self.buf[:4 + size]
+            yield packet
+
+
+# =====================================================================
+# Heartbeat
+# =====================================================================
+def enable_keepalive(sock: socket.socket, idle: int = 2,
+                     interval: int = 1, count: int = 3):
+    """Turn on TCP keepalive with short timers, where the OS allows it."""
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "SIO_KEEPALIVE_VALS"):  # Windows
+            sock.ioctl(socket.SIO_KEEPALIVE_VALS,
+                       (1, idle * 1000, interval * 1000))
+            return
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle)
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count)
+    except OSError:
+        pass
+
+
+class Heartbeat:
+    """Track /eos/ping round trips for one connection.
+
+    The session is dead once max_missed pings in a row go unanswered.
+    Consoles that never answer a ping are left to TCP keepalive, so an
+    old showfile/console version can't cause a reconnect loop.
+    """
+
+    HISTORY = 20
+
+    def __init__(self, interval: float = HEARTBEAT_INTERVAL,
+                 max_missed: int = HEARTBEAT_MAX_MISSED):
+        self.interval = interval
+        self.max_missed = max_missed
+        self.seq = 0
+        self.sent: dict[str, float] = {}
+        self.next_ping = 0.0
+        self.missed = 0
+        self.replied = False
+        self.rtt: float | None = None  # seconds, smoothed
+        self.history: list[bool] = []
+
+    def _result(self, ok: bool):
+        self.history.append(ok)
+        del self.history[:-self.HISTORY]
+
+    def poll(self, now: float) -> bytes | None:
+        """Return a ping packet if one is due."""
+        if now < self.next_ping:
+            return None
+        # Whatever is still outstanding from the last round was missed
+        for token, t in list(self.sent.items()):
+            if now - t >= self.interval:
+                del self.sent[token]
+                self.missed += 1
+                self._result(False)
+        self.seq += 1
+        token = f"spotcue:{self.seq}"
+        self.sent[token] = now
+        self.next_ping = now + self.interval
+        return build_osc_packet("/eos/ping", token)
+
+    def on_reply(self, args: list, now: float) -> bool:
+        """Handle /eos/out/ping; returns True if it answered our ping."""
+        for a in args:
+            t = self.sent.pop(a, None) if isinstance(a, str) else None
+            if t is not None:
+                rtt = now - t
+                self.rtt = rtt if self.rtt is None else \
+                    0.8 * self.rtt + 0.2 * rtt
+                self.missed = 0
+                self.replied = True
+                self._result(True)
+                return True
+        return False
+
+    @property
+    def dead(self) -> bool:
+        return self.replied and self.missed >= self.max_missed
+
+    @property
+    def quality(self) -> float:
+        """Fraction of recent pings answered (0.0–1.0)."""
+        if not self.history:
+            return 1.0
+        return sum(self.history) / len(self.history)
+
+
+def tcp_session_loop(eos_ip, adapter_ip, stop, on_cue, on_status,
+                     on_link=None, heartbeat_interval=HEARTBEAT_INTERVAL,
+                     heartbeat_misses=HEARTBEAT_MAX_MISSED, port=EOS_PORT):
+    """Connect to EOS and feed cue packets to on_cue until stop is set.
+
+    on_link(rtt_ms, quality) reports heartbeat results; rtt_ms is None
+    while there is no live link. Shared by the in-process TCP thread and
+    the ingest child process.
+    """
+    on_link = on_link or (lambda rtt, quality: None)
+
+    while not stop.is_set():
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(5)
+            enable_keepalive(sock)
+
+            # Bind to selected adapter
+            try:
+                if adapter_ip and adapter_ip != "0.0.0.0":
+                    sock.bind((adapter_ip, 0))
+            except Exception:
+                pass
+
+            sock.connect((eos_ip, port))
+            on_status("CONNECTED")
+
+            # Short reads so pings go out even when the console is quiet
+            sock.settimeout(min(0.25, heartbeat_interval / 2))
+            heartbeat = Heartbeat(heartbeat_interval, heartbeat_misses)
+            buf = PacketBuffer()
+
+            while not stop.is_set():
+                now = time.monotonic()
+                missed = heartbeat.missed
+                ping = heartbeat.poll(now)
+                if ping:
+                    sock.sendall(ping)
+                if heartbeat.missed > missed and heartbeat.replied:
+                    # Show the drop in quality while pings go unanswered
+                    on_link(heartbeat.rtt * 1000, heartbeat.quality)
+                if heartbeat.dead:
+                    raise ConnectionError("heartbeat lost")
+
+                try:
+                    chunk = sock.recv(65536)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    break
+                buf.feed(chunk)
+
+                for packet in buf.packets():
+                    cue = parse_eos_cue(packet)
+                    if cue:
+                        on_cue(*cue)
+                        continue
+
+                    addr, offset = parse_osc_string(packet, 0)
+                    if addr == "/eos/out/ping" and heartbeat.on_reply(
+                            parse_osc_args(packet, offset), time.monotonic()):
+                        on_link(heartbeat.rtt * 1000, heartbeat.quality)
+
+            sock.close()
+            on_link(None, 0.0)
+
+        except Exception:
+            if sock is not None:
+                sock.close()
+            on_link(None, 0.0)
+            on_status("RECONNECTING…")
+            time.sleep(2)
+
+    on_status("DISCONNECTED")
+
+
+# =====================================================================
+# Console discovery
+# =====================================================================
+DISCOVERY_TIMEOUT = 0.5       # per-host connect timeout, seconds
+DISCOVERY_CONCURRENCY = 128   # simultaneous connection attempts
+DISCOVERY_MAX_HOSTS = 1024    # larger subnets fall back to the local /24
+DISCOVERY_UDP_PORT = 8000     # EOS default OSC UDP receive port
+
+
+def discovery_hosts(adapter_ip: str, mask: str) -> list[str]:
+    """Addresses to probe on the adapter's subnet, excluding itself."""
+    try:
+        net = ipaddress.IPv4Network(f"{adapter_ip}/{mask}", strict=False)
+    except ValueError:
+        net = ipaddress.IPv4Network(f"{adapter_ip}/24", strict=False)
+    if net.num_addresses > DISCOVERY_MAX_HOSTS:
+        net = ipaddress.IPv4Network(f"{adapter_ip}/24", strict=False)
+    return [str(h) for h in net.hosts() if str(h) != adapter_ip]
+
+
+async def _probe_tcp(host, port, timeout, sem, bind_ip):
+    import asyncio
+
+    async with sem:
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port,
+                    local_addr=(bind_ip, 0) if bind_ip else None),
+                timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        rtt = time.perf_counter() - start
+        writer.close()
+        return host, rtt
+
+
+async def _probe_udp(broadcast, port, timeout, bind_ip):
+    """Broadcast /eos/ping over UDP and collect any replies."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    replies: dict[str, float] = {}
+    start = time.perf_counter()
+
+    class Probe(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            replies.setdefault(addr[0], time.perf_counter() - start)
+
+    try:
+        transport, _ = await loop.create_datagram_endpoint(
+            Probe, local_addr=(bind_ip or "0.0.0.0", 0),
+            allow_broadcast=True)
+    except OSError:
+        return []
+    try:
+        # UDP OSC has no length prefix
+        transport.sendto(build_osc_packet("/eos/ping", "spotcue:discover")[4:],
+                         (broadcast, port))
+        await asyncio.sleep(timeout)
+    except OSError:
+        pass
+    finally:
+        transport.close()
+    return list(replies.items())
+
+
+async def discover_consoles_async(hosts, port=EOS_PORT,
+                                  timeout=DISCOVERY_TIMEOUT,
+                                  concurrency=DISCOVERY_CONCURRENCY,
+                                  bind_ip=None, udp_broadcast=None,
+                                  udp_port=DISCOVERY_UDP_PORT):
+    import asyncio
+
+    sem = asyncio.Semaphore(concurrency)
+    jobs = [_probe_tcp(h, port, timeout, sem, bind_ip) for h in hosts]
+    if udp_broadcast:
+        jobs.append(_probe_udp(udp_broadcast, udp_port, timeout, bind_ip))
+    results = await asyncio.gather(*jobs)
+
+    # TCP probes give one (host, rtt) or None; the UDP probe gives a list
+    found = [r for r in results if r and not isinstance(r, list)]
+    for res in results:
+        if isinstance(res, list):
+            found += res
+
+    best: dict[str, float] = {}
+    for host, rtt in found:
+        best[host] = min(rtt, best.get(host, rtt))
+    return sorted(best.items(), key=lambda kv: kv[1])
+
+
+def discover_consoles(adapter_ip: str, mask: str, port: int = EOS_PORT,
+                      udp: bool = True, **kwargs) -> list[tuple[str, float]]:
+    """Probe the adapter's subnet for EOS listeners.
+
+    Returns (ip, response time in seconds), fastest first. Blocks, so
+    call it off the Tk thread.
+    """
+    import asyncio
+
+    hosts = discovery_hosts(adapter_ip, mask)
+    if udp and hosts:
+        try:
+            net = ipaddress.IPv4Network(f"{adapter_ip}/{mask}", strict=False)
+            kwargs.setdefault("udp_broadcast", str(net.broadcast_address))
+        except ValueError:
+            pass
+    bind_ip = adapter_ip if adapter_ip != "0.0.0.0" else None
+    return asyncio.run(discover_consoles_async(
+        hosts, port, bind_ip=bind_ip, **kwargs))
+
+
+# =====================================================================
+# Show timeline (whole-show precompute)
+# =====================================================================
+def parse_cue_list(text: str) -> list[float]:
+    """Parse "1 2 3.5, 4-10" into cue numbers; a-b ranges step by 1."""
+    cues = []
+    for tok in re.split(r"[,\s]+", text.strip()):
+        if not tok:
+            continue
+        m = re.fullmatch(r"(\d+)-(\d+)", tok)
+        if m:
+            if int(m[1]) > int(m[2]):
+                raise ValueError(f"Range runs backwards: {tok!r}")
+            cues += [float(c) for c in range(int(m[1]), int(m[2]) + 1)]
+            continue
+        try:
+            cues.append(float(tok))
+        except ValueError:
+            raise ValueError(f"Not a cue number: {tok!r}") from None
+    return cues
+
+
+def _first_in_window(sorted_vals, rows, queries):
+    """For each query, the lowest row whose value is within EPS, else -1.
+
+    sorted_vals are ascending and rows[i] is the row for sorted_vals[i].
+    """
+    import numpy as np
+
+    lo = np.searchsorted(sorted_vals, queries - EPS, side="right")
+    hi = np.searchsorted(sorted_vals, queries + EPS, side="left")
+    out = np.full(len(queries), -1)
+    if not len(sorted_vals):
+        return out
+
+    hit = hi > lo
+    out[hit] = rows[lo[hit]]
+    # Near-duplicate cue numbers: fall back to a scan of the window
+    for j in np.flatnonzero(hi - lo > 1):
+        out[j] = rows[lo[j]:hi[j]].min()
+    return out
+
+
+def build_timeline(df: pd.DataFrame, eos_cues) -> pd.DataFrame:
+    """What the display shows after each EOS cue, for a whole show at once.
+
+    Mirrors update_display_for_eos and update_visual_for_lx, but maps
+    every cue in one vectorized pass over sorted cue numbers. Returns one
+    row per EOS cue with the callsheet row shown as Current, Next and
+    Visual (-1 for none; Current is -1 before the first cue) and whether
+    the EOS cue matched a callsheet cue exactly.
+    """
+    import numpy as np
+    import pandas as pd
+
+    cues = np.asarray(eos_cues, dtype=float)
+    n = len(cues)
+    lx = df["LX Cue (num)"].to_numpy(dtype=float)
+    num_rows = np.flatnonzero(~np.isnan(lx))  # numeric rows, sheet order
+    num_lx = lx[num_rows]
+
+    current = np.full(n, -1)
+    nxt = np.full(n, -1)
+    visual = np.full(n, -1)
+    exact = np.zeros(n, dtype=bool)
+
+    if n and len(num_rows):
+        order = np.argsort(num_lx, kind="stable")
+        svals = num_lx[order]
+
+        # Exact match wins, else the last numeric row (sheet order) <= cue
+        pos = _first_in_window(svals, order, cues)
+        exact = pos >= 0
+        k = np.searchsorted(svals, cues, side="right")
+        last_below = np.maximum.accumulate(order)[np.maximum(k - 1, 0)]
+        pos = np.where(exact, pos, np.where(k > 0, last_below, -1))
+        pos[cues < num_lx[0]] = -1  # waiting for first cue
+
+        live = pos >= 0
+        current[live] = num_rows[pos[live]]
+        next_pos = np.where(live, pos + 1, 0)
+        has_next = next_pos < len(num_rows)
+        nxt[has_next] = num_rows[next_pos[has_next]]
+
+        # Visual rows trigger on the last numeric cue above them
+        is_visual = df["LX Cue"].astype(str).str.lower().to_numpy() == "visual"
+        vis_rows = np.flatnonzero(is_visual)
+        before = np.searchsorted(num_rows, vis_rows) - 1
+        vis_rows, before = vis_rows[before >= 0], before[before >= 0]
+        if len(vis_rows):
+            trig = num_lx[before]
+            vorder = np.argsort(trig, kind="stable")
+            shown_lx = np.where(live, num_lx[np.maximum(pos, 0)], num_lx[0])
+            visual = _first_in_window(trig[vorder], vis_rows[vorder], shown_lx)
+
+    return pd.DataFrame({
+        "EOS Cue": cues,
+        "Current": current,
+        "Next": nxt,
+        "Visual": visual,
+        "Exact": exact,
+    })
+
+
+def timeline_problems(df: pd.DataFrame, timeline: pd.DataFrame) -> list[str]:
+    """Callsheet issues a timeline exposes, e.g. mis-numbered cues."""
+    problems = []
+    lx = df["LX Cue (num)"]
+    numeric = lx[lx.notna()]
+
+    # CSV line numbers: header is line 1
+    for i, val in numeric[numeric.diff() <= 0].items():
+        problems.append(
+            f"Line {i + 2}: LX {val:g} is not after the cue before it")
+
+    fired = set(timeline.loc[timeline["Exact"], "Current"])
+    for i, val in numeric.items():
+        if i not in fired:
+            problems.append(
+                f"Line {i + 2}: LX {val:g} never fires in this cue list")
+
+    shown = set(timeline["Visual"])
+    visual = df.index[df["LX Cue"].astype(str).str.lower() == "visual"]
+    for i in visual:
+        if i not in shown:
+            problems.append(f"Line {i + 2}: VISUAL is never shown")
+
+    return problems
+
+
+def running_order(df: pd.DataFrame, timeline: pd.DataFrame) -> pd.DataFrame:
+    """Printable running order: one line of text per section per cue."""
+    import pandas as pd
+
+    summaries = format_row_summaries(df)
+
+    def text(rows, empty):
+        return [summaries[r] if r >= 0 else empty for r in rows]
+
+    return pd.DataFrame({
+        "Step": range(1, len(timeline) + 1),
+        "EOS Cue": [f"{c:g}" for c in timeline["EOS Cue"]],
+        "Current": text(timeline["Current"], "Waiting for first cue…"),
+        "Next": text(timeline["Next"], "End of cues"),
+        "Visual": text(timeline["Visual"], ""),
+    })
+
+
+def fetch_console_cue_list(eos_ip: str, adapter_ip: str, cue_list: int = 1,
+                           timeout: float = 5.0) -> list[float]:
+    """Ask the console for every cue number in a cue list, in order.
+
+    The console's count includes cue parts, each with its own index, so
+    the list is complete once every index has replied. Parts of the same
+    cue collapse to one cue number.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        if adapter_ip and adapter_ip != "0.0.0.0":
+            sock.bind((adapter_ip, 0))
+        sock.connect((eos_ip, EOS_PORT))
+        sock.sendall(build_osc_packet(f"/eos/get/cue/{cue_list}/count"))
+
+        buf = PacketBuffer()
+        count = None
+        replies: dict[int, float] = {}  # index -> cue number
+        deadline = time.monotonic() + timeout
+
+        while count is None or len(replies) < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError("Console did not send the whole cue list")
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Console closed the connection")
+            buf.feed(chunk)
+
+            for packet in buf.packets():
+                addr, offset = parse_osc_string(packet, 0)
+                parts = addr.split("/")
+                if addr == f"/eos/out/get/cue/{cue_list}/count":
+                    args = parse_osc_args(packet, offset)
+                    count = int(args[0]) if args else 0
+                    for i in range(count):
+                        sock.sendall(build_osc_packet(
+                            f"/eos/get/cue/{cue_list}/index/{i}"))
+                # /eos/out/get/cue/<list>/<cue>/<part>/list/<index>/<count>
+                elif len(parts) >= 11 and parts[1:5] == \
+                        ["eos", "out", "get", "cue"] and \
+                        parts[5] == str(cue_list) and parts[8] == "list":
+                    try:
+                        replies[int(parts[9])] = float(parts[6])
+                    except ValueError:
+                        pass
+
+        cues = []
+        for i in sorted(replies):
+            if not cues or cues[-1] != replies[i]:
+                cues.append(replies[i])
+        return cues
+    finally:
+        sock.close()
+
+
+# =====================================================================
+# Ingest process + shared-memory state
+# =====================================================================
+# Fixed layout, written only by the ingest process:
+#   seq (u64)             seqlock counter, odd while a write is in progress
+#   active_events (u64)   bumped on every active cue packet
+#   pending_events (u64)  bumped on every pending cue packet
+#   active (f64)          latest active cue, NaN if none yet
+#   pending (f64)         latest pending cue, NaN if none yet
+#   rtt_ms (f64)          smoothed heartbeat round trip, NaN if no link
+#   quality (f64)         fraction of recent pings answered
+#   status (u8)           index into STATUS_CODES
+# The payload follows seq and is packed separately, so seq is only ever
+# written on its own: odd before the payload, even after it.
+SHM_SEQ = struct.Struct("<Q")
+SHM_PAYLOAD = struct.Struct("<QQddddB7x")
+SHM_LAYOUT = struct.Struct("<QQQddddB7x")
+STATUS_CODES = ("UNKNOWN", "CONNECTED", "RECONNECTING…", "DISCONNECTED")
+
+
+class SharedCueState:
+    """Seqlock-guarded view of the latest EOS state in shared memory."""
+
+    def __init__(self, name: str | None = None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True,
+                                                  size=SHM_LAYOUT.size)
+            self.owner = True
+            self.shm.buf[:SHM_LAYOUT.size] = SHM_LAYOUT.pack(
+                0, 0, 0, math.nan, math.nan, math.nan, 0.0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+
+        self.name = self.shm.name
+        self._fields = list(SHM_LAYOUT.unpack_from(self.shm.buf, 0))
+        if self._fields[0] % 2:
+            # A previous writer died mid-update; close its write out
+            self._fields[0] += 1
+            self._publish()
+
+    # Writer side (ingest process) ---------------------------------------
+    def _publish(self):
+        buf = self.shm.buf
+        seq = self._fields[0]
+        SHM_SEQ.pack_into(buf, 0, seq + 1)  # odd: write in progress
+        SHM_PAYLOAD.pack_into(buf, SHM_SEQ.size, *self._fields[1:])
+        self._fields[0] = seq + 2
+        SHM_SEQ.pack_into(buf, 0, seq + 2)  # even: payload complete
+
+    def write_cue(self, section: str, cue: float):
+        if section == "active":
+            self._fields[1] += 1
+            self._fields[3] = cue
+        else:
+            self._fields[2] += 1
+            self._fields[4] = cue
+        self._publish()
+
+    def write_link(self, rtt_ms: float | None, quality: float):
+        self._fields[5] = math.nan if rtt_ms is None else rtt_ms
+        self._fields[6] = quality
+        self._publish()
+
+    def write_status(self, text: str):
+        self._fields[7] = STATUS_CODES.index(text) \
+            if text in STATUS_CODES else 0
+        self._publish()
+
+    def reset_link(self):
+        """Clear status and RTT before a new writer takes over."""
+        self._fields = list(SHM_LAYOUT.unpack_from(self.shm.buf, 0))
+        if self._fields[0] % 2:
+            self._fields[0] += 1
+        self._fields[5] = math.nan
+        self._fields[6] = 0.0
+        self._fields[7] = 0
+        self._publish()
+
+    # Reader side (GUI process) ------------------------------------------
+    def snapshot(self, retries: int = 100) -> tuple | None:
+        """Return a consistent copy of the fields, or None if contended."""
+        buf = self.shm.buf
+        for _ in range(retries):
+            (seq,) = SHM_SEQ.unpack_from(buf, 0)
+            if seq % 2:
+                continue
+            payload = SHM_PAYLOAD.unpack_from(buf, SHM_SEQ.size)
+            if SHM_SEQ.unpack_from(buf, 0)[0] == seq:
+                return (seq, *payload)
+        return None
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def ingest_process_main(shm_name, eos_ip, adapter_ip, stop,
+                        heartbeat_interval=HEARTBEAT_INTERVAL,
+                        heartbeat_misses=HEARTBEAT_MAX_MISSED):
+    """Child process entry: run the TCP/OSC pipeline into shared memory."""
+    state = SharedCueState(shm_name)
+    try:
+        tcp_session_loop(eos_ip, adapter_ip, stop,
+                         state.write_cue, state.write_status,
+                         state.write_link, heartbeat_interval,
+                         heartbeat_misses)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state.close()
+
+
+class IngestSupervisor:
+    """Owns the ingest child process and restarts it if it dies."""
+
+    RESTART_DELAY = 1.0
+
+    def __init__(self, heartbeat_interval=HEARTBEAT_INTERVAL,
+                 heartbeat_misses=HEARTBEAT_MAX_MISSED):
+        self.state = SharedCueState()
+        self.heartbeat = (heartbeat_interval, heartbeat_misses)
+        self.proc: mp.Process | None = None
+        self.stop: mp.synchronize.Event | None = None
+        self.params: tuple[str, str] | None = None
+        self.restarts = 0
+        self._died_at: float | None = None
+
+    def start(self, eos_ip: str, adapter_ip: str):
+        self.shutdown()
+        self.params = (eos_ip, adapter_ip)
+        self._spawn()
+
+    def _spawn(self):
+        # Don't let the GUI show the previous child's link as live
+        self.state.reset_link()
+        self.stop = mp.Event()
+        self.proc = mp.Process(
+            target=ingest_process_main,
+            args=(self.state.name, *self.params, self.stop,
+                  *self.heartbeat),
+            name="SpotCue-ingest", daemon=True
+        )
+        self.proc.start()
+        self._died_at = None
+
+    def check(self) -> bool:
+        """Restart a crashed child. Returns True if a restart happened."""
+        if self.params is None or self.proc is None or self.proc.is_alive():
+            return False
+        now = time.monotonic()
+        if self._died_at is None:
+            self._died_at = now
+        if now - self._died_at < self.RESTART_DELAY:
+            return False
+        self.proc.join(0)
+        self.restarts += 1
+        self._spawn()
+        return True
+
+    def shutdown(self):
+        if self.proc is None:
+            return
+        self.stop.set()
+        # The child may be blocked in recv; don't wait on it for long
+        self.proc.join(0.2)
+        if self.proc.is_alive():
+            self.proc.terminate()
+            self.proc.join(1)
+        self.proc = None
+
+    def close(self):
+        self.params = None
+        self.shutdown()
+        self.state.close()
+
+
+# =====================================================================
+# Callsheet Overview (virtualized)
+# =====================================================================
+class CallsheetOverview:
+    """Scrollable whole-callsheet list drawn on one Canvas.
+
+    Only the rows in view are drawn. A fixed pool of rectangle/text items
+    is repositioned as the list scrolls, so the cost of a redraw depends
+    on the window height, not on the length of the callsheet.
+    """
+
+    ROW_H = 28
+
+    def __init__(self, parent):
+        self.frame = tk.Frame(parent, bg="black")
+
+        tk.Label(self.frame, text="Callsheet", fg="white", bg="black",
+                 font=("Arial", 18)).pack(anchor="nw")
+
+        self.canvas = tk.Canvas(self.frame, bg="black", width=380,
+                                highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.frame, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.rows: list[str] = []
+        self.visual_rows: set[int] = set()
+        self.current: int | None = None
+        self.next: int | None = None
+        self.top = 0.0  # scroll offset in pixels
+        self._viewport_h = 1
+
+        self._pool: list[tuple[int, int]] = []
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+
+    # -----------------------------------------------------------------
+    def set_rows(self, df: pd.DataFrame):
+        self.rows = format_row_summaries(df)
+        self.visual_rows = set(
+            df.index[df["LX Cue"].astype(str).str.lower() == "visual"]
+        )
+        self.current = self.next = None
+        self.top = 0.0
+        self.redraw()
+
+    def set_position(self, current: int | None, next_: int | None):
+        # Pending-cue packets re-run the display update; only follow the
+        # live position when it has actually moved, so a scroll-ahead
+        # survives until the next cue.
+        if (current, next_) == (self.current, self.next):
+            return
+        self.current = current
+        self.next = next_
+        self.follow()
+
+    def follow(self):
+        """Scroll so the live row is in view."""
+        live = self.current if self.current is not None else self.next
+        if live is not None:
+            self.scroll_to(live)
+        else:
+            self.redraw()
+
+    def scroll_to(self, idx: int):
+        # Keep the live row about a third of the way down
+        self.top = idx * self.ROW_H - self.canvas.winfo_height() / 3
+        self._clamp()
+        self.redraw()
+
+    # -----------------------------------------------------------------
+    def yview(self, *args):
+        total = len(self.rows) * self.ROW_H
+        if args[0] == "moveto":
+            self.top = float(args[1]) * total
+        elif args[0] == "scroll":
+            n = int(args[1])
+            if args[2] == "pages":
+                self.top += n * self.canvas.winfo_height()
+            else:
+                self.top += n * self.ROW_H
+        self._clamp()
+        self.redraw()
+
+    def _on_configure(self, event):
+        # While hidden the canvas is 1 px tall and scroll_to can't place
+        # the live row; re-follow once it has a real size
+        if self._viewport_h <= 1:
+            self._viewport_h = event.height
+            self.follow()
+            return
+        self._viewport_h = event.height
+        self._clamp()
+        self.redraw()
+
+    def _on_wheel(self, event):
+        self.yview("scroll", -3 if event.delta > 0 else 3, "units")
+
+    def _clamp(self):
+        total = len(self.rows) * self.ROW_H
+        self.top = max(0.0, min(self.top, total - self.canvas.winfo_height()))
+
+    # -----------------------------------------------------------------
+    def redraw(self):
+        height = self.canvas.winfo_height()
+        width = self.canvas.winfo_width()
+        visible = height // self.ROW_H + 2
+
+        while len(self._pool) < visible:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, width=0)
+            text = self.canvas.create_text(0, 0, anchor="w",
+                                           font=("Arial", 14))
+            self._pool.append((rect, text))
+
+        first = int(self.top // self.ROW_H)
+        offset = first * self.ROW_H - self.top
+
+        for slot, (rect, text) in enumerate(self._pool):
+            i = first + slot
+            if slot >= visible or i >= len(self.rows):
+                self.canvas.itemconfigure(rect, state="hidden")
+                self.canvas.itemconfigure(text, state="hidden")
+                continue
+
+            if i == self.current:
+                bg, fg = "#005500", "white"
+            elif i == self.next:
+                bg, fg = "#550000", "white"
+            else:
+                bg = "black"
+                fg = "darkgrey" if i in self.visual_rows else "white"
+
+            y = offset + slot * self.ROW_H
+            self.canvas.coords(rect, 0, y, width, y + self.ROW_H)
+            self.canvas.itemconfigure(rect, fill=bg, state="normal")
+            self.canvas.coords(text, 6, y + self.ROW_H / 2)
+            self.canvas.itemconfigure(text, text=self.rows[i], fill=fg,
+                                      state="normal")
+
+        total = len(self.rows) * self.ROW_H
+        if total > 0:
+            self.scrollbar.set(self.top / total,
+                               min(1.0, (self.top + height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+# =====================================================================
+# Show Preview
+# =====================================================================
+class TimelinePreview:
+    """Scrub through a precomputed show and export the running order."""
+
+    def __init__(self, app: SpotCueApp):
+        self.app = app
+        self.df = app.df
+        self.timeline: pd.DataFrame | None = None
+
+        win = tk.Toplevel(app.root)
+        win.title("Show Preview")
+        win.geometry("1000x680")
+        win.configure(bg="black")
+        self.window = win
+
+        # Cue source ----------------------------------------------------
+        src = tk.Frame(win, bg="black")
+        src.pack(fill="x", padx=12, pady=10)
+
+        tk.Label(src, text="Console cues:", fg="cyan", bg="black",
+                 font=("Arial", 12, "bold")).pack(side="left")
+        self.cues_var = tk.StringVar()
+        entry = tk.Entry(src, textvariable=self.cues_var, width=50)
+        entry.pack(side="left", padx=6, fill="x", expand=True)
+        entry.bind("<Return>", lambda e: self.build())
+
+        for text, cmd in (("Build", self.build),
+                          ("Load file…", self.load_file),
+                          ("From console", self.from_console),
+                          ("From session", self.from_session)):
+            tk.Button(src, text=text, bg="#222222", fg="white",
+                      command=cmd).pack(side="right", padx=3)
+
+        # Scrubber ------------------------------------------------------
+        self.step_label = tk.Label(win, text="Enter cues and press Build.",
+                                   fg="orange", bg="black",
+                                   font=("Arial", 16))
+        self.step_label.pack(anchor="w", padx=12)
+
+        self.scale = tk.Scale(win, from_=0, to=0, orient="horizontal",
+                              showvalue=False, bg="black", fg="white",
+                              highlightthickness=0, troughcolor="#222222",
+                              command=lambda v: self.show_step(int(v)))
+        self.scale.pack(fill="x", padx=12)
+
+        # Sections ------------------------------------------------------
+        panes = tk.Frame(win, bg="black")
+        panes.pack(fill="both", expand=True, padx=12, pady=6)
+        self.section_text = {}
+        for col, name in enumerate(("Current", "Next", "Visual")):
+            panes.columnconfigure(col, weight=1, uniform="pane")
+            tk.Label(panes, text=name, fg="white", bg="black",
+                     font=("Arial", 16)).grid(row=0, column=col, sticky="w")
+            lbl = tk.Label(panes, text="", fg="white", bg="black",
+                           font=("Arial", 13), anchor="nw", justify="left",
+                           wraplength=300)
+            lbl.grid(row=1, column=col, sticky="nsew", padx=4)
+            self.section_text[name] = lbl
+        panes.rowconfigure(1, weight=1)
+
+        # Problems + export ---------------------------------------------
+        bottom = tk.Frame(win, bg="black")
+        bottom.pack(fill="x", padx=12, pady=10)
+
+        self.problems = tk.Text(bottom, height=7, fg="white", bg="black",
+                                font=("Consolas", 11))
+        sb = ttk.Scrollbar(bottom, command=self.problems.yview)
+        self.problems["yscrollcommand"] = sb.set
+        tk.Button(bottom, text="Export running order…", bg="#222222",
+                  fg="white", command=self.export).pack(side="bottom",
+                                                        anchor="e", pady=(6, 0))
+        sb.pack(side="right", fill="y")
+        self.problems.pack(fill="x")
+        self.problems.config(state="disabled")
+
+    # -----------------------------------------------------------------
+    def from_session(self):
+        self.cues_var.set(" ".join(f"{c:g}" for c in self.app.engine.session_log))
+
+    def load_file(self):
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Cue lists", "*.txt *.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8-sig") as f:
+                self.cues_var.set(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Cue list", f"Could not read {path}:\n{e}",
+                                 parent=self.window)
+
+    def from_console(self):
+        self.step_label.config(text="Reading cue list from console…")
+        eos_ip, adapter_ip = self.app.eos_ip, self.app.adapter_ip
+
+        def worker():
+            try:
+                cues = fetch_console_cue_list(eos_ip, adapter_ip)
+                done = lambda: self._got_console_cues(cues)
+            except Exception as e:
+                msg = f"Could not read cue list: {e}"
+                done = lambda: (self.window.winfo_exists()
+                                and self.step_label.config(text=msg))
+            self.app.root.after(0, done)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _got_console_cues(self, cues):
+        if self.window.winfo_exists():
+            self.cues_var.set(" ".join(f"{c:g}" for c in cues))
+            self.build()
+
+    # -----------------------------------------------------------------
+    def build(self):
+        self.df = self.app.df
+        if self.df is None or self.df.empty:
+            messagebox.showerror("No CSV", "Load a callsheet first.",
+                                 parent=self.window)
+            return
+        try:
+            cues = parse_cue_list(self.cues_var.get())
+        except ValueError as e:
+            messagebox.showerror("Cue list", str(e), parent=self.window)
+            return
+        if not cues:
+            messagebox.showerror("Cue list", "No cues entered.",
+                                 parent=self.window)
+            return
+
+        self.timeline = build_timeline(self.df, cues)
+        self.scale.config(to=len(self.timeline) - 1)
+        self.scale.set(0)
+        self.show_step(0)
+
+        problems = timeline_problems(self.df, self.timeline)
+        self.problems.config(state="normal")
+        self.problems.delete("1.0", "end")
+        self.problems.insert("1.0", "\n".join(problems) or "No problems found.")
+        self.problems.config(state="disabled")
+
+    def show_step(self, i: int):
+        if self.timeline is None:
+            return
+        step = self.timeline.iloc[i]
+        exact = "" if step["Exact"] else "  (not in callsheet)"
+        self.step_label.config(
+            text=f"Step {i + 1}/{len(self.timeline)} — "
+                 f"EOS {step['EOS Cue']:g}{exact}")
+
+        for name, empty in (("Current", "Waiting for first cue…"),
+                            ("Next", "End of cues"), ("Visual", "")):
+            row = step[name]
+            text = format_row(self.df.loc[row]) if row >= 0 else empty
+            self.section_text[name].config(text=text)
+
+    def export(self):
+        if self.timeline is None:
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.window, defaultextension=".txt",
+            filetypes=[("Text", "*.txt"), ("CSV", "*.csv")])
+        if not path:
+            return
+        order = running_order(self.df, self.timeline)
+        if path.lower().endswith(".csv"):
+            order.to_csv(path, index=False)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(order.to_string(index=False))
+
+
+# =====================================================================
+# Auto-fit text layout
+# =====================================================================
+class TextFitter:
+    """Pick the largest font size whose word-wrapped text fits a box.
+
+    Results are kept in an LRU keyed by (row text, box size, font family).
+    Measuring is done through Tk, so it must run on the Tk thread.
+    """
+
+    def __init__(self, family: str = "Arial", min_size: int = 10,
+                 max_size: int = 36, cache_size: int = 256):
+        self.family = family
+        self.min_size = min_size
+        self.max_size = max_size
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, int] = OrderedDict()
+        self._fonts: dict[int, tkfont.Font] = {}
+
+    def font(self, size: int) -> tkfont.Font:
+        if size not in self._fonts:
+            self._fonts[size] = tkfont.Font(family=self.family, size=size)
+        return self._fonts[size]
+
+    def lookup(self, text: str, width: int, height: int) -> int | None:
+        key = (text, width, height, self.family)
+        size = self._cache.get(key)
+        if size is not None:
+            self._cache.move_to_end(key)
+        return size
+
+    def fit(self, text: str, width: int, height: int) -> int:
+        size = self.lookup(text, width, height)
+        if size is not None:
+            return size
+
+        # Binary search: fitting is monotonic in font size
+        lo, hi = self.min_size, self.max_size
+        size = self.min_size
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if self._fits(text, mid, width, height):
+                size = mid
+                lo = mid + 1
+            else:
+                hi = mid - 1
+
+        self._cache[(text, width, height, self.family)] = size
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return size
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def _fits(self, text: str, size: int, width: int, height: int) -> bool:
+        font = self.font(size)
+        max_lines = height // font.metrics("linespace")
+        space = font.measure(" ")
+        lines = 0
+
+        for para in text.split("\n"):
+            lines += 1
+            x = 0
+            for word in para.split(" "):
+                w = font.measure(word)
+                if w > width:
+                    # Tk breaks over-long words mid-word
+                    lines += w // width
+                    w %= width
+                if x and x + space + w > width:
+                    lines += 1
+                    x = w
+                else:
+                    x = x + space + w if x else w
+            if lines > max_lines:
+                return False
+        return True
+
+
+# =====================================================================
+# Soak test (headless)
+# =====================================================================
+SOAK_SAMPLE_MINUTES = 10          # simulated minutes between samples
+SOAK_MAX_RSS_GROWTH_MB = 25.0
+SOAK_MAX_TRACED_GROWTH_MB = 10.0
+SOAK_MAX_OBJECT_GROWTH = 50_000
+SOAK_MAX_LATENCY_RATIO = 3.0      # late p99 vs baseline p99
+SOAK_LATENCY_FLOOR_MS = 1.0       # ignore ratios below this absolute p99
+SOAK_MIN_SAMPLES = 4              # fewer can't give a baseline and a trend
+SOAK_TEXT_BOX = (600, 180)        # section size the fitter works to
+
+
+def current_rss() -> int | None:
+    """Resident set size in bytes, or None if the platform won't say."""
+    try:
+        with open("/proc/self/statm") as f:
+            import os
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD),
+                        ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t),
+                        ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t),
+                        ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(Counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(
+                handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def _synthetic_callsheet(rows: int = 500) -> pd.DataFrame:
+    import pandas as pd
+
+    data = []
+    for i in range(1, rows + 1):
+        lx = "VISUAL" if i % 25 == 0 else f"{i / 2:g}"
+        data.append((lx, f"Actor {i % 12} DSC", str(i % 4 * 3),
+                     "HB", "L201", "Note " * (i % 5)))
+    df = pd.DataFrame(data, columns=["LX Cue", "Pickup", "Level",
+                                     "Size", "Colour", "Note"])
+    df["LX Cue (num)"] = pd.to_numeric(df["LX Cue"], errors="coerce")
+    return df
+
+
+def _p99(values: list[float]) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * 0.99))]
+
+
+class _FixedPitchFont(NamedTuple):
+    """Stands in for tkfont.Font so TextFitter can run without Tk."""
+    size: int
+
+    def measure(self, text: str) -> int:
+        return len(text) * self.size * 3 // 5
+
+    def metrics(self, option: str) -> int:
+        return self.size * 6 // 5  # linespace
+
+
+class HeadlessFitter(TextFitter):
+    """TextFitter (search and LRU unchanged) measuring a fixed-pitch font."""
+
+    def font(self, size: int) -> _FixedPitchFont:
+        return _FixedPitchFont(size)
+
+
+class FakeConsole(threading.Thread):
+    """Local stand-in EOS console that streams a simulated show over TCP.
+
+    Simulated time runs as fast as the display keeps up: noise streams
+    at full speed, but a cue packet is only sent once the previous one
+    has reached the display, so the backlog never hides in a queue. It
+    answers /eos/ping and stamps every cue packet so latency can be
+    measured at the display end.
+    """
+
+    NOISE = (("/eos/out/active/chan", "1 [100]"),
+             ("/eos/out/softkey/1", "Label"),
+             ("/eos/out/active/wheel/1", "Intens [50]", 1, 50.0))
+
+    def __init__(self, cues: list[float], total: int, rate: int,
+                 cue_every: float):
+        super().__init__(name="SpotCue-fake-console", daemon=True)
+        self.cues = cues
+        self.total = total
+        self.rate = rate
+        self.per_cue = max(1, int(cue_every * rate))
+        self.sent = 0
+        self.stamps: deque = deque()  # send time of each cue packet
+        self.done = threading.Event()
+        self.stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+    def _send(self, conn, data):
+        with self._lock:
+            conn.sendall(data)
+
+    def _answer_pings(self, conn):
+        buf = PacketBuffer()
+        try:
+            while not self.stop.is_set():
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                buf.feed(chunk)
+                for packet in buf.packets():
+                    addr, offset = parse_osc_string(packet, 0)
+                    if addr == "/eos/ping":
+                        self._send(conn, build_osc_packet(
+                            "/eos/out/ping", *parse_osc_args(packet, offset)))
+        except OSError:
+            pass
+
+    def run(self):
+        conn, _ = self.server.accept()
+        threading.Thread(target=self._answer_pings, args=(conn,),
+                         daemon=True).start()
+        noise = [build_osc_packet(*n) for n in self.NOISE]
+        batch = bytearray()
+        cue_i = 0
+
+        try:
+            for i in range(self.total):
+                # A cue fire, a once-a-second pending refresh, else noise
+                if i % self.per_cue == 0:
+                    cue_i = (cue_i + 1) % len(self.cues)
+                    addr = f"/eos/out/active/cue/1/{self.cues[cue_i]:g}"
+                elif i % self.rate == 0:
+                    nxt = self.cues[(cue_i + 1) % len(self.cues)]
+                    addr = f"/eos/out/pending/cue/1/{nxt:g}"
+                else:
+                    addr = None
+
+                if addr:
+                    if batch:
+                        self._send(conn, batch)
+                        batch = bytearray()
+                    while self.stamps and not self.stop.is_set():
+                        time.sleep(0.0005)
+                    batch += build_osc_packet(addr)
+                    self.stamps.append(time.perf_counter())
+                else:
+                    batch += noise[i % len(noise)]
+                if addr or len(batch) > 16384:
+                    self._send(conn, batch)
+                    batch = bytearray()
+                self.sent = i + 1
+
+            if batch:
+                self._send(conn, batch)
+            self.done.set()
+            self.stop.wait()
+        except OSError:
+            self.done.set()
+        finally:
+            conn.close()
+            self.server.close()
+
+
+def run_soak(hours: float = 8.0, rate: int = 200, cue_every: float = 45.0,
+             csv_path: str | None = None,
+             sample_minutes: float = SOAK_SAMPLE_MINUTES,
+             max_rss_growth_mb: float = SOAK_MAX_RSS_GROWTH_MB,
+             max_traced_growth_mb: float = SOAK_MAX_TRACED_GROWTH_MB,
+             max_object_growth: int = SOAK_MAX_OBJECT_GROWTH,
+             max_latency_ratio: float = SOAK_MAX_LATENCY_RATIO) -> bool:
+    """Stream a simulated show through the live ingest/display path.
+
+    A FakeConsole on localhost feeds tcp_session_loop (heartbeat
+    included) on a worker thread, which queues a lambda per cue packet as
+    _tcp_loop does with root.after. The main thread plays the Tk loop:
+    it runs those callbacks through the app's CueEngine, then does the
+    idle work show_view schedules (section fitting and prefitting the
+    upcoming rows through a TextFitter). Only widget painting is left
+    out. Memory, GC and event-to-display latency are sampled every
+    sample_minutes of simulated time.
+
+    GC collection counts are printed but not limited, since they rise
+    with allocation rate rather than with leaks; growth in GC-tracked
+    objects is the check that stands in for them. The tracemalloc lines
+    that grew most since the baseline sample are listed at the end, so a
+    failure names its source. Returns True if everything stayed within
+    the limits.
+    """
+    import gc
+    import queue
+    import tracemalloc
+
+    if hours <= 0 or rate <= 0 or cue_every <= 0 or sample_minutes <= 0:
+        raise ValueError("Soak hours, rate, cue interval and sample "
+                         "interval must all be positive")
+
+    df = read_csv(csv_path) if csv_path else _synthetic_callsheet()
+    cues = df["LX Cue (num)"].dropna().tolist()
+    if not cues:
+        raise ValueError("Callsheet has no numbered LX cues")
+
+    total = int(hours * 3600 * rate)
+    per_sample = max(1, int(sample_minutes * 60 * rate))
+    expected = total // per_sample
+    if expected < SOAK_MIN_SAMPLES:
+        print(f"[soak] FAIL: only {expected} sample(s) in this run; need "
+              f"{SOAK_MIN_SAMPLES} to set a baseline. Lengthen the run or "
+              f"shorten the sample interval.")
+        return False
+
+    console = FakeConsole(cues, total, rate, cue_every)
+    engine = CueEngine()
+    engine.df = df
+    fitter = HeadlessFitter()
+    idle: deque = deque()
+    pulses = 0
+    events: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    def on_cue(section, cue):
+        # Same per-packet closures as SpotCueApp._tcp_loop
+        if section == "active":
+            events.put(lambda: engine.active(cue))
+        else:
+            events.put(lambda: engine.pending(cue))
+
+    def show_view(view):
+        # SpotCueApp.show_view, less the widgets: a fit-cache miss is
+        # fitted at idle, then the upcoming rows are prefitted
+        nonlocal pulses
+        if view is None:
+            return
+        pulses += view.pulse
+        for text in (view.current_text, view.next_text, view.visual_text):
+            if fitter.lookup(text, *SOAK_TEXT_BOX) is None:
+                idle.append(lambda t=text: fitter.fit(t, *SOAK_TEXT_BOX))
+        for text in engine.upcoming_texts(engine.last_idx):
+            idle.append(lambda t=text: fitter.fit(t, *SOAK_TEXT_BOX))
+
+    statuses: list[str] = []
+    session = threading.Thread(
+        target=tcp_session_loop, name="SpotCue-soak-tcp",
+        args=("127.0.0.1", "0.0.0.0", stop, on_cue, statuses.append),
+        kwargs={"port": console.port}, daemon=True)
+
+    latencies: list[float] = []
+    samples = []
+    next_sample = per_sample
+    # Compare the end of the run against a baseline after warm-up
+    base_i = max(1, expected // 10)
+    base_snapshot = None
+
+    def take_sample():
+        traced, _ = tracemalloc.get_traced_memory()
+        rss = current_rss()
+        sample = {
+            "sim_s": console.sent / rate,
+            "rss": rss,
+            "traced": traced,
+            "objects": len(gc.get_objects()),
+            "gc": tuple(st["collections"] for st in gc.get_stats()),
+            "p99": _p99(latencies),
+            "backlog": events.qsize(),
+        }
+        samples.append(sample)
+        latencies.clear()
+        h, m = divmod(int(sample["sim_s"]) // 60, 60)
+        rss_mb = f"{rss / 2**20:8.1f}" if rss else "     n/a"
+        print(f"[soak] {h:3d}h{m:02d}m    {rss_mb}  "
+              f"{traced / 2**20:9.2f}  {sample['objects']:8,}  "
+              f"{'/'.join(map(str, sample['gc'])):>11}  "
+              f"{sample['p99'] * 1000:7.3f}  {sample['backlog']:7,}",
+              flush=True)
+
+    tracemalloc.start()
+    print(f"[soak] {hours:g} h at {rate} msg/s = {total:,} packets", flush=True)
+    print("[soak]  sim time     RSS MB  traced MB   objects  gc gen0/1/2"
+          "   p99 ms  backlog", flush=True)
+    started = time.perf_counter()
+    console.start()
+    session.start()
+
+    try:
+        while True:
+            try:
+                callback = events.get(timeout=0.05)
+            except queue.Empty:
+                if console.done.is_set() and not console.stamps:
+                    break
+                if not session.is_alive():
+                    raise RuntimeError("TCP session thread exited")
+                continue
+
+            show_view(callback())
+            # Every queued callback is one cue packet, delivered in order
+            latencies.append(time.perf_counter() - console.stamps.popleft())
+            while idle:
+                idle.popleft()()
+
+            if console.sent >= next_sample:
+                if len(samples) == base_i:
+                    # Before sampling, so the baseline counts the snapshot
+                    base_snapshot = tracemalloc.take_snapshot()
+                take_sample()
+                next_sample += per_sample
+
+        if not samples or samples[-1]["sim_s"] * rate < console.sent:
+            take_sample()
+        snapshot = tracemalloc.take_snapshot()
+        top = snapshot.statistics("lineno")[:5]
+        grew = snapshot.compare_to(base_snapshot, "lineno")[:10] \
+            if base_snapshot else []
+    finally:
+        stop.set()
+        console.stop.set()
+        tracemalloc.stop()
+
+    print(f"[soak] finished in {time.perf_counter() - started:.1f}s real; "
+          f"{pulses:,} pulses, {len(engine.session_log):,} cues "
+          f"logged, link status {statuses[-1] if statuses else 'n/a'}",
+          flush=True)
+    print("[soak] top allocators:")
+    for stat in top:
+        print(f"[soak]   {stat}")
+    if grew:
+        print("[soak] growth since baseline:")
+        for stat in grew:
+            print(f"[soak]   {stat}")
+
+    failures = []
+    if len(samples) < SOAK_MIN_SAMPLES:
+        failures.append(f"only {len(samples)} sample(s); need "
+                        f"{SOAK_MIN_SAMPLES} to set a baseline")
+    else:
+        base = samples[min(base_i, len(samples) - 1)]
+        last = samples[-1]
+
+        if base["rss"] and last["rss"]:
+            growth = (last["rss"] - base["rss"]) / 2**20
+            if growth > max_rss_growth_mb:
+                failures.append(f"RSS grew {growth:.1f} MB")
+        growth = (last["traced"] - base["traced"]) / 2**20
+        if growth > max_traced_growth_mb:
+            failures.append(f"traced memory grew {growth:.1f} MB")
+        growth = last["objects"] - base["objects"]
+        if growth > max_object_growth:
+            failures.append(f"GC-tracked objects grew by {growth:,}")
+        late = max(s["p99"] for s in samples[len(samples) * 3 // 4:])
+        if late * 1000 > SOAK_LATENCY_FLOOR_MS and \
+           late > base["p99"] * max_latency_ratio:
+            failures.append(f"p99 latency rose from "
+                            f"{base['p99'] * 1000:.3f} to "
+                            f"{late * 1000:.3f} ms")
+
+    for f in failures:
+        print(f"[soak] FAIL: {f}")
+    if not failures:
+        print("[soak] PASS")
+    return not failures
+
+
+# =====================================================================
+# Startup timing
+# =====================================================================
+class StartupReport:
+    """Per-phase startup timings, printed when --startup-report is given.
+
+    Times are seconds since the module started importing. Phases may run
+    on worker threads, so recording is locked.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._record("imports", 0.0, _T_IMPORTS - _T0)
+
+    def _record(self, name: str, start: float, end: float):
+        with self._lock:
+            if name in self.phases:
+                return
+            self.phases[name] = (start, end)
+        if self.enabled:
+            print(f"[startup] {name:<10} {start:7.3f}s → {end:7.3f}s "
+                  f"({(end - start) * 1000:6.1f} ms)", flush=True)
+
+    @contextmanager
+    def span(self, name: str):
+        start = time.perf_counter() - _T0
+        try:
+            yield
+        finally:
+            self._record(name, start, time.perf_counter() - _T0)
+
+    def mark(self, name: str):
+        """Record a point event (only the first occurrence counts)."""
+        t = time.perf_counter() - _T0
+        self._record(name, t, t)
+
+
+def warm_imports():
+    """Import heavy modules off the Tk thread so the first CSV load is quick."""
+    import pandas  # noqa: F401
+
+
 # =====================================================================
 # Main Application
 # =====================================================================
 class SpotCueApp:
-    def __init__(self):
+    def __init__(self, ingest_process: bool = False,
+                 startup_report: bool = False,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL,
+                 heartbeat_misses: int = HEARTBEAT_MAX_MISSED):
+        self.startup = StartupReport(startup_report)
+
         # Data
         self.df: pd.DataFrame | None = None
-        self.current_cue: float | None = None
-        self.current_lx: float | None = None
-        self.next_lx: float | None = None
-        self.pending_cue: float | None = None
+        self.engine = CueEngine()  # cue state, shared with the soak test
 
-        # Network
+        # Network (adapters are scanned in the background at startup)
         self.eos_ip = "10.101.90.11"
-        self.adapters = list_adapters()
-        self.adapter_ip = self.adapters[0][1]
+        self.adapters = [UNKNOWN_ADAPTER]
+        self.adapter_ip = UNKNOWN_ADAPTER[1]
+        self.link_status = "UNKNOWN"
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_misses = heartbeat_misses
 
         # TCP control
         self.tcp_stop = threading.Event()
         self.tcp_thread: threading.Thread | None = None
 
+        # Optional ingest child process (see IngestSupervisor)
+        self.ingest: IngestSupervisor | None = \
+            IngestSupervisor(heartbeat_interval, heartbeat_misses) \
+            if ingest_process else None
+        self._shm_events = (0, 0)
+        self._shm_link = None
+        self._shm_status = None
+        self._shm_polling = False
+
         # TK window
         self.root = tk.Tk()
         self.root.title("SpotCue")
         self.root.configure(bg="black")
         self.root.geometry("1280x720")
-        self.root.iconbitmap("spotcue.ico")
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Settings window handle
         self.settings_window: tk.Toplevel | None = None
         self.settings_status_label: tk.Label | None = None
         self.adapter_info: tk.Label | None = None
+        self.preview: TimelinePreview | None = None
 
         # Pulse state
         self._pulse_active = False
-        self._last_current_text = None
+
+        # Auto-fit text (see TextFitter)
+        self.fitter = TextFitter()
+        self._fit_boxes: dict[tk.Label, tuple[int, int]] = {}
+        self._fit_queued: set[tk.Label] = set()
+        self._resize_job = None
+        self._prefit_gen = 0
 
         # Build UI
-        self.build_ui()
+        with self.startup.span("ui"):
+            self.build_ui()
+
+        # Connection, adapter scan and heavy imports run while the
+        # operator is still picking a CSV
+        self.start_tcp_client()
+        threading.Thread(target=self._scan_adapters, daemon=True).start()
+        threading.Thread(target=self._warm_imports, daemon=True).start()
+
+        # Must load CSV at startup, once the window is up
+        self.root.after_idle(self._finish_startup)
+
+    # -----------------------------------------------------------------
+    # Startup
+    # -----------------------------------------------------------------
+    def _finish_startup(self):
+        self.root.update_idletasks()
+        self.startup.mark("window")
+
+        with self.startup.span("icon"):
+            try:
+                self.root.iconbitmap("spotcue.ico")
+            except tk.TclError:
+                pass
 
-        # Must load CSV at startup
         self.prompt_csv_if_missing()
 
-        # Start TCP thread
-        self.start_tcp_client()
+    def _warm_imports(self):
+        with self.startup.span("pandas"):
+            warm_imports()
+
+    def _scan_adapters(self):
+        with self.startup.span("adapters"):
+            adapters = list_adapters()
+        self.root.after(0, lambda: self._apply_adapters(adapters))
+
+    def _apply_adapters(self, adapters):
+        self.adapters = adapters
+        if self.adapter_ip != UNKNOWN_ADAPTER[1]:
+            return
+        self.adapter_ip = adapters[0][1]
+        # Only rebind if the unbound first attempt hasn't already connected
+        if self.link_status != "CONNECTED" and \
+           self.adapter_ip != UNKNOWN_ADAPTER[1]:
+            self.start_tcp_client()
 
     # -----------------------------------------------------------------
     # Build UI
@@ -298,18 +2148,28 @@ class SpotCueApp:
                   command=self.open_help).pack(side="right", padx=6, pady=6)
         tk.Button(topbar, text="[⚙]", fg="white", bg="#222222",
                   command=self.open_settings).pack(side="right", padx=6, pady=6)
+        tk.Button(topbar, text="[≡]", fg="white", bg="#222222",
+                  command=self.toggle_overview).pack(side="right", padx=6, pady=6)
+        tk.Button(topbar, text="[▶]", fg="white", bg="#222222",
+                  command=self.open_preview).pack(side="right", padx=6, pady=6)
 
         # Main grid
         grid = tk.Frame(self.root, bg="black")
         grid.pack(fill="both", expand=True)
 
+        # Sections don't size to their text (see TextFitter), so split
+        # the rows evenly instead of by content
         for r in range(2):
-            grid.rowconfigure(r, weight=1)
+            grid.rowconfigure(r, weight=1, uniform="row")
         for c in range(2):
             grid.columnconfigure(c, weight=1)
 
         self.grid = grid
 
+        # Whole-callsheet overview, hidden until toggled
+        self.overview = CallsheetOverview(self.root)
+        self.overview_visible = False
+
         # CURRENT -------------------------------------------------------
         self.frame_current = tk.Frame(
             grid, bg="black",
@@ -317,6 +2177,7 @@ class SpotCueApp:
             highlightbackground="black", highlightcolor="black"
         )
         self.frame_current._orig_color = "black"
+        self.frame_current.pack_propagate(False)
         self.frame_current.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
 
         hdr = tk.Frame(self.frame_current, bg="black")
@@ -331,6 +2192,7 @@ class SpotCueApp:
             font=("Arial", 24), anchor="nw", justify="left"
         )
         self.current_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.current_text.bind("<Configure>", self._on_text_resize)
 
         # NEXT ----------------------------------------------------------
         self.frame_next = tk.Frame(
@@ -338,6 +2200,7 @@ class SpotCueApp:
             highlightthickness=10,
             highlightbackground="black", highlightcolor="black"
         )
+        self.frame_next.pack_propagate(False)
         self.frame_next.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
 
         hdr = tk.Frame(self.frame_next, bg="black")
@@ -352,6 +2215,7 @@ class SpotCueApp:
             font=("Arial", 24), anchor="nw", justify="left"
         )
         self.next_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.next_text.bind("<Configure>", self._on_text_resize)
 
         # EOS -----------------------------------------------------------
         self.frame_eos = tk.Frame(grid, bg="black")
@@ -372,12 +2236,19 @@ class SpotCueApp:
         )
         self.eos_pending_label.pack(fill="x", padx=10)
 
+        self.eos_link_label = tk.Label(
+            self.frame_eos, text="Link: —",
+            fg="grey", bg="black", anchor="w", font=("Arial", 16)
+        )
+        self.eos_link_label.pack(fill="x", padx=10, pady=(5, 0))
+
         # VISUAL --------------------------------------------------------
         self.frame_visual = tk.Frame(
             grid, bg="black",
             highlightthickness=10,
             highlightbackground="black", highlightcolor="black"
         )
+        self.frame_visual.pack_propagate(False)
         self.frame_visual.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
 
         hdr = tk.Frame(self.frame_visual, bg="black")
@@ -392,6 +2263,89 @@ class SpotCueApp:
             font=("Arial", 24), anchor="nw", justify="left"
         )
         self.visual_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.visual_text.bind("<Configure>", self._on_text_resize)
+
+    # -----------------------------------------------------------------
+    # Auto-fit text
+    # -----------------------------------------------------------------
+    def _text_box(self, label) -> tuple[int, int]:
+        return self._fit_boxes.get(label, (0, 0))
+
+    def set_section_text(self, label, text):
+        """Set a section's text using only cached layout.
+
+        A cache miss keeps the current font and queues the fit for idle
+        time, so no measuring happens on the cue-fire path.
+        """
+        label.config(text=text)
+        w, h = self._text_box(label)
+        if w < 20 or h < 20:
+            return
+        size = self.fitter.lookup(text, w, h)
+        if size is not None:
+            label.config(font=(self.fitter.family, size), wraplength=w)
+        elif label not in self._fit_queued:
+            self._fit_queued.add(label)
+            self.root.after_idle(self._refit, label)
+
+    def _refit(self, label):
+        self._fit_queued.discard(label)
+        w, h = self._text_box(label)
+        if w < 20 or h < 20:
+            return
+        size = self.fitter.fit(label.cget("text"), w, h)
+        label.config(font=(self.fitter.family, size), wraplength=w)
+
+    def _prefit_upcoming(self, idx):
+        """Warm the fit cache for the next few rows, one per idle slot."""
+        texts = self.engine.upcoming_texts(idx)
+        if not texts:
+            return
+        boxes = {self._text_box(lbl) for lbl in
+                 (self.current_text, self.next_text, self.visual_text)}
+        work = [(text, box) for text in texts for box in boxes
+                if box[0] >= 20 and box[1] >= 20]
+
+        self._prefit_gen += 1
+        gen = self._prefit_gen
+
+        def step():
+            # A newer cue has superseded this batch
+            if not work or gen != self._prefit_gen:
+                return
+            text, (w, h) = work.pop(0)
+            self.fitter.fit(text, w, h)
+            self.root.after_idle(step)
+
+        self.root.after_idle(step)
+
+    def _on_text_resize(self, event):
+        box = (event.width - 8, event.height - 8)
+        if self._fit_boxes.get(event.widget) == box:
+            return
+        self._fit_boxes[event.widget] = box
+        # Wait for the resize to settle before throwing the cache away
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(150, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_job = None
+        self.fitter.invalidate()
+        for label in (self.current_text, self.next_text, self.visual_text):
+            self._refit(label)
+        self._prefit_upcoming(self.engine.last_idx)
+
+    # -----------------------------------------------------------------
+    def toggle_overview(self):
+        if self.overview_visible:
+            self.overview.frame.pack_forget()
+        else:
+            self.overview.frame.pack(side="right", fill="y", padx=5,
+                                     pady=5, before=self.grid)
+            self.root.update_idletasks()
+            self.overview.follow()
+        self.overview_visible = not self.overview_visible
 
     # -----------------------------------------------------------------
     def _make_status(self, parent):
@@ -414,7 +2368,7 @@ class SpotCueApp:
         self.upload_csv()
         if self.df is None or self.df.empty:
             messagebox.showerror("No CSV", "Cannot run without CSV.")
-            self.root.destroy()
+            self.on_close()
 
     # -----------------------------------------------------------------
     # Settings Window
@@ -426,7 +2380,7 @@ class SpotCueApp:
 
         win = tk.Toplevel(self.root)
         win.title("Settings")
-        win.geometry("520x340")
+        win.geometry("520x420")
         win.configure(bg="black")
         self.settings_window = win
 
@@ -470,9 +2424,23 @@ class SpotCueApp:
         ip_entry.bind("<Return>", lambda e: self._update_eos_ip())
         ip_entry.bind("<FocusOut>", lambda e: self._update_eos_ip())
 
+        self.discover_button = tk.Button(
+            frame, text="Discover", bg="#222222", fg="white",
+            command=self._discover_consoles
+        )
+        self.discover_button.grid(row=2, column=2, padx=6)
+
+        self.discover_label = tk.Label(frame, text="", fg="white",
+                                       bg="black", justify="left")
+        self.discover_label.grid(row=4, column=0, columnspan=3)
+
+        # One button per discovered console; the operator picks one
+        self.discover_results = tk.Frame(frame, bg="black")
+        self.discover_results.grid(row=5, column=0, columnspan=3)
+
         # Connection status
         self.settings_status_label = tk.Label(
-            frame, text="Status: UNKNOWN", fg="orange", bg="black",
+            frame, text=f"Status: {self.link_status}", fg="orange", bg="black",
             font=("Arial", 14)
         )
         self.settings_status_label.grid(row=3, column=0, columnspan=2, pady=10)
@@ -493,12 +2461,65 @@ class SpotCueApp:
                 self.adapter_info.config(text=f"{ip} / {mask}")
                 self.start_tcp_client()
 
+    def _discover_consoles(self):
+        mask = next((m for _, ip, m in self.adapters
+                     if ip == self.adapter_ip), "Unknown")
+        if self.adapter_ip == UNKNOWN_ADAPTER[1]:
+            self.discover_label.config(text="Select an adapter first.")
+            return
+
+        self.discover_button.config(state="disabled")
+        self.discover_label.config(text="Searching…")
+        adapter_ip = self.adapter_ip
+
+        def worker():
+            try:
+                found = discover_consoles(adapter_ip, mask)
+            except Exception:
+                found = []
+            self.root.after(0, lambda: self._show_discovered(found))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_discovered(self, found):
+        if not (self.settings_window and self.settings_window.winfo_exists()):
+            return
+        self.discover_button.config(state="normal")
+        for w in self.discover_results.winfo_children():
+            w.destroy()
+        if not found:
+            self.discover_label.config(text="No consoles found.")
+            return
+
+        # Fastest first; nothing changes until the operator picks one
+        self.discover_label.config(text="Found (fastest first):")
+        for ip, rtt in found[:5]:
+            current = " ✓" if ip == self.eos_ip else ""
+            tk.Button(
+                self.discover_results, bg="#222222", fg="white",
+                text=f"{ip} ({rtt * 1000:.0f} ms){current}",
+                command=lambda ip=ip: self._pick_discovered(ip)
+            ).pack(side="left", padx=3, pady=3)
+
+    def _pick_discovered(self, ip):
+        if ip == self.eos_ip and self.link_status == "CONNECTED":
+            return
+        self.eos_ip_var.set(ip)
+        self._update_eos_ip()
+
     def _update_eos_ip(self):
         ip = self.eos_ip_var.get().strip()
         if ip:
             self.eos_ip = ip
             self.start_tcp_client()
 
+    # -----------------------------------------------------------------
+    def open_preview(self):
+        if self.preview and self.preview.window.winfo_exists():
+            self.preview.window.lift()
+            return
+        self.preview = TimelinePreview(self)
+
     # -----------------------------------------------------------------
     def open_help(self):
         win = tk.Toplevel(self.root)
@@ -521,6 +2542,13 @@ class SpotCueApp:
     # TCP OSC
     # -----------------------------------------------------------------
     def start_tcp_client(self):
+        if self.ingest is not None:
+            self.ingest.start(self.eos_ip, self.adapter_ip)
+            if not self._shm_polling:
+                self._shm_polling = True
+                self.root.after(FRAME_MS, self._poll_shared_state)
+            return
+
         self.tcp_stop.set()
         self.tcp_stop = threading.Event()
         t = threading.Thread(target=self._tcp_loop, daemon=True)
@@ -528,70 +2556,99 @@ class SpotCueApp:
         t.start()
 
     def _update_settings_status(self, text):
+        self.link_status = text
+        if text == "CONNECTED":
+            self.startup.mark("connected")
         if self.settings_status_label and \
            self.settings_window and self.settings_window.winfo_exists():
             self.settings_status_label.config(text=f"Status: {text}")
 
     def _tcp_loop(self):
-        while not self.tcp_stop.is_set():
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
+        def on_cue(section, cue):
+            if section == "active":
+                self.root.after(0, lambda: self._handle_active(cue))
+            else:
+                self.root.after(0, lambda: self._handle_pending(cue))
 
-                # Bind to selected adapter
-                try:
-                    if self.adapter_ip and self.adapter_ip != "0.0.0.0":
-                        sock.bind((self.adapter_ip, 0))
-                except Exception:
-                    pass
-
-                sock.connect((self.eos_ip, EOS_PORT))
-                self._update_settings_status("CONNECTED")
-                sock.settimeout(None)
-
-                while not self.tcp_stop.is_set():
-                    packet = read_packet(sock)
-                    if not packet:
-                        break
-
-                    addr, _ = parse_osc_string(packet, 0)
-                    parts = addr.split("/")
-
-                    if len(parts) >= 7 and parts[1] == "eos" \
-                       and parts[2] == "out" and parts[4] == "cue":
-                        section = parts[3]
-                        cu = parts[6]
-                        try:
-                            cue = float(cu)
-                        except:
-                            continue
-
-                        if section == "active":
-                            self.root.after(0, lambda c=cue: self._handle_active(c))
-                        elif section == "pending":
-                            self.root.after(0, lambda c=cue: self._handle_pending(c))
+        stop = self.tcp_stop
 
-                sock.close()
+        def on_status(text):
+            # Ignore a superseded session still winding down
+            if stop is self.tcp_stop:
+                self._update_settings_status(text)
 
-            except Exception:
-                self._update_settings_status("RECONNECTING…")
-                time.sleep(2)
+        def on_link(rtt_ms, quality):
+            if stop is self.tcp_stop:
+                self.root.after(0, lambda: self._update_link(rtt_ms, quality))
+
+        tcp_session_loop(self.eos_ip, self.adapter_ip, stop,
+                         on_cue, on_status, on_link,
+                         self.heartbeat_interval, self.heartbeat_misses)
 
-        self._update_settings_status("DISCONNECTED")
+    def _update_link(self, rtt_ms, quality):
+        if rtt_ms is None:
+            self.eos_link_label.config(text="Link: —", fg="grey")
+            return
+        if quality >= 0.99 and rtt_ms < 50:
+            colour = "green"
+        elif quality >= 0.6:
+            colour = "orange"
+        else:
+            colour = "red"
+        self.eos_link_label.config(
+            text=f"Link: {rtt_ms:.0f} ms · {quality:.0%}", fg=colour
+        )
+
+    def _poll_shared_state(self):
+        # Frame tick: only the latest state is applied, so a flood of
+        # packets costs the GUI one redraw per frame at most.
+        if self.ingest is None:
+            return
+        try:
+            self._apply_shared_state()
+        finally:
+            # A failing handler mustn't stop the tick (and crash restarts)
+            self.root.after(FRAME_MS, self._poll_shared_state)
+
+    def _apply_shared_state(self):
+        if self.ingest.check():
+            self._shm_status = "RESTARTING INGEST…"
+            self._update_settings_status(self._shm_status)
+
+        snap = self.ingest.state.snapshot()
+        if snap is not None:
+            _, n_active, n_pending, active, pending, rtt, quality, status \
+                = snap
+
+            if n_active != self._shm_events[0] and not math.isnan(active):
+                self._handle_active(active)
+            if n_pending != self._shm_events[1] and not math.isnan(pending):
+                self._handle_pending(pending)
+            self._shm_events = (n_active, n_pending)
+
+            link = (None if math.isnan(rtt) else round(rtt), quality)
+            if link != self._shm_link:
+                self._shm_link = link
+                self._update_link(None if math.isnan(rtt) else rtt, quality)
+
+            text = STATUS_CODES[status]
+            # Keep "RESTARTING INGEST…" until the new child reports in
+            restarting = text == "UNKNOWN" and \
+                self._shm_status == "RESTARTING INGEST…"
+            if text != self._shm_status and not restarting:
+                self._shm_status = text
+                self._update_settings_status(text)
 
     # -----------------------------------------------------------------
     # Active / Pending
     # -----------------------------------------------------------------
     def _handle_active(self, cue):
-        self.current_cue = cue
         self.eos_active_label.config(text=f"Active: {cue}")
-        self.update_display_for_eos(cue)
+        self.show_view(self.engine.active(cue))
 
     def _handle_pending(self, cue):
-        self.pending_cue = cue
         self.eos_pending_label.config(text=f"Pending: {cue}")
-        if self.current_cue is not None:
-            self.update_display_for_eos(self.current_cue)
+        self.show_view(self.engine.pending(cue))
 
     # -----------------------------------------------------------------
     # NO-BOUNCE PULSE (colour only)
@@ -621,16 +2678,7 @@ class SpotCueApp:
                 self._pulse_active = False
                 return
 
-            # Triangle wave 0→1→0
-            if i <= steps:
-                t = i / steps
-            else:
-                t = (2 * steps - i) / steps
-
-            # Green fade 30% → 100% → 30%
-            g = int(255 * (0.3 + 0.7 * t))
-            g = max(0, min(255, g))
-            col = f"#00{g:02x}00"
+            col = pulse_colour(i, steps)
 
             # Colour only — NO thickness change → NO movement
             self.frame_current.config(
@@ -671,84 +2719,40 @@ class SpotCueApp:
     # Display update
     # -----------------------------------------------------------------
     def update_display_for_eos(self, eos_cue):
-        if self.df is None or self.df.empty:
-            return
+        self.show_view(self.engine.view(eos_cue))
 
-        df = self.df
-        numeric = df[df["LX Cue (num)"].notna()]
-        if numeric.empty:
+    def show_view(self, view: CueView | None):
+        if view is None:
             return
 
-        first_lx = numeric.iloc[0]["LX Cue (num)"]
+        df = self.df
+        state = view.state
 
-        # BEFORE FIRST CUE -------------------------------------------------
-        if eos_cue < first_lx:
-            txt = "Waiting for first cue…"
-            self.current_text.config(text=txt)
+        # Current — pulse on change
+        if state.current is None:
             self._update_status(self.current_status, None)
-            self._last_current_text = txt
-
-            first_row = numeric.iloc[0]
-            self.next_lx = first_row["LX Cue (num)"]
-            self.next_text.config(text=format_row(first_row))
-            self._update_status(self.next_status, first_row.get("Level"))
-
-            self.update_visual_for_lx(first_lx)
-
-            if self.pending_cue and abs(self.pending_cue - first_lx) < EPS:
-                self.set_frame_bg(self.frame_next, "#550000")
-            else:
-                self.set_frame_bg(self.frame_next, "black")
-
-            return
-
-        # NORMAL MAPPING --------------------------------------------------
-        exact = numeric[abs(numeric["LX Cue (num)"] - eos_cue) < EPS]
-        if not exact.empty:
-            idx = exact.index[0]
         else:
-            idx = numeric[numeric["LX Cue (num)"] <= eos_cue].index[-1]
-
-        row = df.loc[idx]
-        lx = row["LX Cue (num)"]
-        self.current_lx = lx
-
-        # Current — pulse on change
-        new_text = format_row(row)
-        if self._last_current_text != new_text:
-            self.pulse()
-
-        self.current_text.config(text=new_text)
-        self._last_current_text = new_text
-        self._update_status(self.current_status, row.get("Level"))
+            if view.pulse:
+                self.pulse()
+            self._update_status(self.current_status,
+                                df.loc[state.current].get("Level"))
+        self.set_section_text(self.current_text, view.current_text)
 
         # Next
-        nxt = numeric[numeric.index > idx]
-        if not nxt.empty:
-            next_row = nxt.iloc[0]
-            self.next_lx = next_row["LX Cue (num)"]
-            self.next_text.config(text=format_row(next_row))
-            self._update_status(self.next_status, next_row.get("Level"))
-        else:
-            self.next_lx = None
-            self.next_text.config(text="End of cues")
-            self._update_status(self.next_status, None)
+        self.set_section_text(self.next_text, view.next_text)
+        self._update_status(self.next_status,
+                            None if state.next is None
+                            else df.loc[state.next].get("Level"))
 
         # Pending highlight
-        if self.pending_cue and self.next_lx:
-            pending_match = numeric[
-                abs(numeric["LX Cue (num)"] - self.pending_cue) < EPS
-            ]
-            if not pending_match.empty and \
-               pending_match.iloc[0]["LX Cue (num)"] == self.next_lx:
-                self.set_frame_bg(self.frame_next, "#550000")
-            else:
-                self.set_frame_bg(self.frame_next, "black")
-        else:
-            self.set_frame_bg(self.frame_next, "black")
+        self.set_frame_bg(self.frame_next,
+                          "#550000" if state.armed else "black")
 
         # Visual
-        self.update_visual_for_lx(lx)
+        self._show_visual(state.visual)
+
+        self.overview.set_position(state.current, state.next)
+        self.root.after_idle(self._prefit_upcoming, self.engine.last_idx)
 
     # -----------------------------------------------------------------
     # Status label (LIVE/DEAD)
@@ -785,30 +2789,21 @@ class SpotCueApp:
     # -----------------------------------------------------------------
     def update_visual_for_lx(self, current_lx):
         if self.df is None or self.df.empty or current_lx is None:
-            self.visual_text.config(text="")
+            self._show_visual(None)
+            return
+        self._show_visual(visual_row_for_lx(self.df, current_lx))
+
+    def _show_visual(self, idx):
+        if idx is None:
+            self.set_section_text(self.visual_text, "")
             self._update_status(self.visual_status, None)
             self.set_frame_bg(self.frame_visual, "black")
             return
 
-        df = self.df
-        numeric = df[df["LX Cue (num)"].notna()]
-        visual = df[df["LX Cue"].astype(str).str.lower() == "visual"]
-
-        for i, row in visual.iterrows():
-            prev = numeric[numeric.index < i]
-            if prev.empty:
-                continue
-            trigger = prev.iloc[-1]["LX Cue (num)"]
-
-            if abs(trigger - current_lx) < EPS:
-                self.visual_text.config(text=format_row(row))
-                self._update_status(self.visual_status, row.get("Level"))
-                self.set_frame_bg(self.frame_visual, "#8B0000")
-                return
-
-        self.visual_text.config(text="")
-        self._update_status(self.visual_status, None)
-        self.set_frame_bg(self.frame_visual, "black")
+        row = self.df.loc[idx]
+        self.set_section_text(self.visual_text, format_row(row))
+        self._update_status(self.visual_status, row.get("Level"))
+        self.set_frame_bg(self.frame_visual, "#8B0000")
 
     # -----------------------------------------------------------------
     # CSV Loading
@@ -818,7 +2813,12 @@ class SpotCueApp:
         if not path:
             return
         try:
-            self.df = read_csv(path)
+            self.df = self.engine.df = read_csv(path)
+            self.overview.set_rows(self.df)
+            self.startup.mark("csv")
+            # Cues may have arrived while the dialog was open
+            if self.engine.current_cue is not None:
+                self.update_display_for_eos(self.engine.current_cue)
             messagebox.showinfo("CSV", "Loaded successfully.")
         except Exception as e:
             messagebox.showerror("CSV Error", str(e))
@@ -826,6 +2826,9 @@ class SpotCueApp:
     # -----------------------------------------------------------------
     def on_close(self):
         self.tcp_stop.set()
+        if self.ingest is not None:
+            self.ingest.close()
+            self.ingest = None
         self.root.destroy()
 
     def run(self):
@@ -835,5 +2838,66 @@ class SpotCueApp:
 # =====================================================================
 # Entry
 # =====================================================================
+def main():
+    parser = argparse.ArgumentParser(description="SpotCue")
+    parser.add_argument(
+        "--ingest-process", action="store_true",
+        help="read the EOS connection in a separate process"
+    )
+    parser.add_argument(
+        "--startup-report", action="store_true",
+        help="print a per-phase startup timing breakdown"
+    )
+    parser.add_argument(
+        "--heartbeat-interval", type=float, default=HEARTBEAT_INTERVAL,
+        help="seconds between console pings (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--heartbeat-misses", type=int, default=HEARTBEAT_MAX_MISSED,
+        help="missed pings before reconnecting (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--soak", action="store_true",
+        help="run a headless long-show soak test and exit"
+    )
+    parser.add_argument(
+        "--soak-hours", type=float, default=8.0,
+        help="simulated show length for --soak (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--soak-rate", type=int, default=200,
+        help="OSC messages per simulated second (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--soak-csv", default=None,
+        help="callsheet for --soak (default: a synthetic 500-row sheet)"
+    )
+    parser.add_argument(
+        "--soak-sample-minutes", type=float, default=SOAK_SAMPLE_MINUTES,
+        help="simulated minutes between soak samples (default: %(default)s)"
+    )
+    args = parser.parse_args()
+
+    if args.heartbeat_interval <= 0 or args.heartbeat_misses <= 0:
+        parser.error("--heartbeat-interval and --heartbeat-misses "
+                     "must be positive")
+
+    if args.soak:
+        if args.soak_hours <= 0 or args.soak_rate <= 0 \
+           or args.soak_sample_minutes <= 0:
+            parser.error("--soak-hours, --soak-rate and "
+                         "--soak-sample-minutes must be positive")
+        ok = run_soak(hours=args.soak_hours, rate=args.soak_rate,
+                      csv_path=args.soak_csv,
+                      sample_minutes=args.soak_sample_minutes)
+        sys.exit(0 if ok else 1)
+
+    SpotCueApp(ingest_process=args.ingest_process,
+               startup_report=args.startup_report,
+               heartbeat_interval=args.heartbeat_interval,
+               heartbeat_misses=args.heartbeat_misses).run()
+
+
 if __name__ == "__main__":
-    SpotCueApp().run()
+    mp.freeze_support()
+    main()